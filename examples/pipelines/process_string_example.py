@@ -12,6 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import argparse
+from bisect import bisect_right
+from collections import defaultdict
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, Tuple
+
 import yaml
 
 from termcolor import colored
@@ -32,36 +38,78 @@ from ft.onto.base_ontology import (
     EntityMention,
 )
 
+parser = argparse.ArgumentParser()
 
-def main():
-    pl = Pipeline[DataPack]()
-    pl.set_reader(StringReader())
-    pl.add(NLTKSentenceSegmenter())
-    pl.add(NLTKWordTokenizer())
-    pl.add(NLTKPOSTagger())
-
-    config = yaml.safe_load(open("config.yml", "r"))
-
-    config = Config(config, default_hparams=None)
-
-    # TODO: update this with models from tagging.
-    # pl.add(CoNLLNERPredictor(), config=config.NER)
-    pl.add(SRLPredictor(), config=config.SRL)
-
-    pl.initialize()
+parser.add_argument(
+    "--input-file",
+    type=str,
+    default=None,
+    help="A text file containing one document per line. The example "
+    "document is used if this is not provided.",
+)
+parser.add_argument(
+    "--disable",
+    nargs="*",
+    choices=["srl"],
+    default=[],
+    help="Names of the optional stages to leave out of the pipeline",
+)
+parser.add_argument(
+    "--interactive",
+    action="store_true",
+    help="Wait for the user to press ENTER after printing each sentence",
+)
 
-    text = (
-        "So I was excited to see Journey to the Far Side of the Sun finally "
-        "get released on an affordable DVD (the previous print had been "
-        "fetching $100 on eBay - I'm sure those people wish they had their "
-        "money back - but more about that in a second)."
-    )
+# The colored headers are the same for every sentence, build them once.
+SENTENCE_HEADER = colored("Sentence:", "red")
+TOKENS_HEADER = colored("Tokens:", "red")
+ENTITIES_HEADER = colored("EntityMentions:", "red")
+SRL_HEADER = colored("Semantic role labels:", "red")
+CONTINUE_PROMPT = colored("Press ENTER to continue...\n", "green")
+
+EXAMPLE_TEXT = (
+    "So I was excited to see Journey to the Far Side of the Sun finally "
+    "get released on an affordable DVD (the previous print had been "
+    "fetching $100 on eBay - I'm sure those people wish they had their "
+    "money back - but more about that in a second)."
+)
 
-    pack = pl.process_one(text)
 
-    for sentence in pack.get(Sentence):
+def read_documents(input_file: Optional[str]) -> Iterator[str]:
+    if input_file is None:
+        yield EXAMPLE_TEXT
+        return
+
+    with open(input_file, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield line
+
+
+def print_pack(pack: DataPack, interactive: bool = False):
+    sentences = list(pack.get(Sentence))
+
+    # Querying links within a sentence scans every link in the pack, so we
+    # assign all the links to their sentences in a single pass instead.
+    sent_begins = [sentence.begin for sentence in sentences]
+    sent_links = defaultdict(list)
+    for link in pack.get(PredicateLink):
+        parent, child = link.get_parent(), link.get_child()
+        sent_idx = bisect_right(sent_begins, parent.begin) - 1
+        if sent_idx < 0:
+            continue
+        sentence = sentences[sent_idx]
+        if (
+            parent.end <= sentence.end
+            and sentence.begin <= child.begin
+            and child.end <= sentence.end
+        ):
+            sent_links[sent_idx].append(link)
+
+    for sent_idx, sentence in enumerate(sentences):
         sent_text = sentence.text
-        print(colored("Sentence:", "red"), sent_text, "\n")
+        print(SENTENCE_HEADER, sent_text, "\n")
         # first method to get entry in a sentence
         tokens = [
             (token.text, token.pos) for token in pack.get(Token, sentence)
@@ -70,12 +118,12 @@ def main():
             (entity.text, entity.ner_type)
             for entity in pack.get(EntityMention, sentence)
         ]
-        print(colored("Tokens:", "red"), tokens, "\n")
-        print(colored("EntityMentions:", "red"), entities, "\n")
+        print(TOKENS_HEADER, tokens, "\n")
+        print(ENTITIES_HEADER, entities, "\n")
 
-        # second method to get entry in a sentence
-        print(colored("Semantic role labels:", "red"))
-        for link in pack.get(PredicateLink, sentence):
+        # second method: use the links grouped by sentence above
+        print(SRL_HEADER)
+        for link in sent_links[sent_idx]:
             parent: PredicateMention = link.get_parent()
             child: PredicateArgument = link.get_child()
             print(
@@ -88,8 +136,66 @@ def main():
             print("      Entities in predicate argument:", entities, "\n")
         print()
 
-        input(colored("Press ENTER to continue...\n", "green"))
+        if interactive:
+            input(CONTINUE_PROMPT)
+
+
+def build_pipeline(disable: Iterable[str] = ()) -> Pipeline[DataPack]:
+    """
+    Build and initialize the pipeline once per process. Loading the models
+    dominates the cost of the first call, so callers that process text
+    repeatedly (e.g. a request handler) should reuse the returned pipeline.
+
+    Stages named in `disable` (currently only `"srl"`) are not added.
+    """
+    # Normalize the argument so that every call asking for the same stages
+    # hits the same cache entry.
+    return _build_pipeline(tuple(sorted(set(disable))))
+
+
+@lru_cache(maxsize=1)
+def _build_pipeline(disable: Tuple[str, ...]) -> Pipeline[DataPack]:
+    pl = Pipeline[DataPack]()
+    pl.set_reader(StringReader())
+    pl.add(NLTKSentenceSegmenter())
+    pl.add(NLTKWordTokenizer())
+    pl.add(NLTKPOSTagger())
+
+    config = yaml.safe_load(open("config.yml", "r"))
+
+    config = Config(config, default_hparams=None)
+
+    # TODO: update this with models from tagging.
+    # pl.add(CoNLLNERPredictor(), config=config.NER)
+    if "srl" not in disable:
+        pl.add(SRLPredictor(), config=config.SRL)
+
+    pl.initialize()
+
+    # Run a tiny document through so that lazy device and kernel setup
+    # happens here instead of on the first real request.
+    pl.process_one("Warm up.")
+
+    return pl
+
+
+def run(text: str, disable: Iterable[str] = ()) -> DataPack:
+    return build_pipeline(disable).process_one(text)
+
+
+def main(
+    input_file: Optional[str] = None,
+    interactive: bool = False,
+    disable: Tuple[str, ...] = (),
+):
+    pl = build_pipeline(disable)
+
+    # The documents are streamed through the pipeline, so the batch
+    # processors can form batches across document boundaries.
+    for pack in pl.process_dataset(read_documents(input_file)):
+        print_pack(pack, interactive)
 
 
 if __name__ == "__main__":
-    main()
+    args = parser.parse_args()
+    main(args.input_file, args.interactive, tuple(args.disable))
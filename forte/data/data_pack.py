@@ -465,8 +465,6 @@ class DataPack(BasePack[Entry, Link, Group]):
             Payload entry containing text data, image or audio data.
 
         """
-        supported_modality = [enum.name for enum in Modality]
-
         payloads_length = -1
         try:
             if modality == Modality.Text:
@@ -482,7 +480,7 @@ class DataPack(BasePack[Entry, Link, Group]):
                 raise ValueError(
                     f"Provided modality {modality.name} is not supported."
                     "Please provide one of modality among"
-                    f" {supported_modality}."
+                    f" {[enum.name for enum in Modality]}."
                 )
         except IndexError as e:
             raise ProcessExecutionException(
@@ -19,7 +19,7 @@ from typing import Dict, List, Iterator, Set, Tuple, Optional, Any
 import uuid
 import logging
 from heapq import heappush, heappop
-from sortedcontainers import SortedList
+from sortedcontainers import SortedList, SortedKeyList
 from typing_inspect import get_origin, get_args, is_generic_type
 
 from forte.utils import get_class
@@ -1679,7 +1679,7 @@ class DataStore(BaseStore):
 
     def _get_bisect_range(
         self,
-        search_list: SortedList,
+        search_list: SortedKeyList,
         range_span: Tuple[int, int],
         type_name: str,
     ) -> Optional[List]:
@@ -1692,8 +1692,9 @@ class DataStore(BaseStore):
         sorted list whose begin and end index falls within `range_span`.
 
         Args:
-            search_list: A `SortedList` object on which the binary search
-                will be carried out.
+            search_list: A `SortedList` object sorted by the ``begin`` and
+                ``end`` fields, on which the binary search will be carried
+                out.
             range_span: a tuple that indicates the start and end index
                 of the range in which we want to get required entries
             type_name: Type of entry represented by the DataStore
@@ -1716,15 +1717,12 @@ class DataStore(BaseStore):
 
         result_list = []
 
-        temp_entry = self.add_entry_raw(
-            type_name=type_name,
-            attribute_data=[range_span[0], range_span[0]],
+        # The list is sorted by (begin, end), so we can bisect directly on
+        # the key of the range start instead of inserting a temporary entry.
+        begin_index = search_list.bisect_key_left(
+            (range_span[0], range_span[0])
         )
 
-        begin_index = search_list.bisect_left(self.get_entry(temp_entry)[0])
-
-        self.delete_entry(temp_entry)
-
         for idx in range(begin_index, len(search_list)):
             if search_list[idx][begin] > range_span[1]:
                 break
@@ -337,31 +337,23 @@ class FList(Generic[ParentEntryType], MutableSequence):
         self, index: Union[int, slice]
     ) -> Union[EntryType, MutableSequence]:
         if isinstance(index, slice):
-            if all(isinstance(val, int) for val in self.__data):
-                # If entry data is stored just be an integer, it indicates
-                # that this is a Single Pack entry (stored just by its tid)
-                return [
-                    self.__parent_entry.pack.get_entry(tid)
-                    for tid in self.__data[index]
-                ]
-            else:
-                # else, it indicates that this is a Multi Pack
-                # entry (stored as a tuple)
-                return [
-                    self.__parent_entry.pack.get_subentry(*attr)
-                    for attr in self.__data[index]
-                ]
-        else:
-            if all(isinstance(val, int) for val in self.__data):
-                # If entry data is stored just be an integer, it indicates
-                # that this is a Single Pack entry (stored just by its tid)
-                return self.__parent_entry.pack.get_entry(self.__data[index])
-            else:
-                # else, it indicates that this is a Multi Pack
-                # entry (stored as a tuple)
-                return self.__parent_entry.pack.get_subentry(
-                    *self.__data[index]
-                )
+            return [self._to_entry(val) for val in self.__data[index]]
+        return self._to_entry(self.__data[index])
+
+    def _to_entry(self, val: Union[int, Tuple[int, int]]) -> EntryType:
+        if isinstance(val, int):
+            # If entry data is stored just be an integer, it indicates
+            # that this is a Single Pack entry (stored just by its tid)
+            return self.__parent_entry.pack.get_entry(val)
+        # else, it indicates that this is a Multi Pack
+        # entry (stored as a tuple)
+        return self.__parent_entry.pack.get_subentry(*val)
+
+    def __iter__(self) -> Iterator[EntryType]:
+        # The default ``MutableSequence.__iter__`` goes through
+        # ``__getitem__`` index by index, iterate the stored data directly.
+        for val in self.__data:
+            yield self._to_entry(val)
 
     def __setitem__(
         self,
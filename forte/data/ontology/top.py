@@ -11,8 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import base64
 import functools
+import heapq
+import io
 from functools import total_ordering
+from operator import itemgetter
 from pathlib import Path
 from typing import (
     Optional,
@@ -29,6 +33,7 @@ from typing import (
 from dataclasses import dataclass
 
 import numpy as np
+from packaging.version import Version
 
 from forte.common.aliases import URL
 from forte.data.base_pack import PackType
@@ -78,6 +83,20 @@ make sure it available across the ontology system:
 """
 
 
+@functools.lru_cache(maxsize=None)
+def _type_name(entry_type: Type[Entry]) -> str:
+    # The parent, child and member type names are stored on every link and
+    # group, but they only depend on the class, so build each string once.
+    return get_full_module_name(entry_type)
+
+
+@functools.lru_cache(maxsize=None)
+def _type_sort_key(entry_type: Type[Entry]) -> str:
+    # Annotations with the same span are ordered by ``str`` of their class,
+    # cache it so that sorting does not format the class name per compare.
+    return str(entry_type)
+
+
 class Generics(Entry):
     def __init__(self, pack: PackType):
         super().__init__(pack=pack)
@@ -102,17 +121,14 @@ class Annotation(Entry):
     payload_idx: int
 
     def __init__(self, pack: PackType, begin: int, end: int):
-        self._span: Optional[Span] = None
         self.begin: int = begin
         self.end: int = end
         super().__init__(pack)
 
     @property
     def span(self) -> Span:
-        # Delay span creation at usage.
-        if self._span is None:
-            self._span = Span(self.begin, self.end)
-        return self._span
+        # Built on access so that it always reflects the stored offsets.
+        return Span(self.begin, self.end)
 
     def __eq__(self, other):
         r"""The eq function of :class:`Annotation`.
@@ -122,13 +138,9 @@ class Annotation(Entry):
         Users can define their own eq function by themselves but this must
         be consistent to :meth:`hash`.
         """
-        if other is None:
+        if other is None or type(self) is not type(other):
             return False
-        return (type(self), self.begin, self.end) == (
-            type(other),
-            other.begin,
-            other.end,
-        )
+        return self.begin == other.begin and self.end == other.end
 
     def __lt__(self, other):
         r"""To support total_ordering, `Annotation` must implement
@@ -141,12 +153,14 @@ class Annotation(Entry):
         3. In the case where both offsets are the same, we break the tie using
            the normal sorting of the class name.
         """
-        if self.begin == other.begin:
-            if self.end == other.end:
-                return str(type(self)) < str(type(other))
-            return self.end < other.end
-        else:
-            return self.begin < other.begin
+        # The offsets live in the data store, so read each of them only once.
+        begin, other_begin = self.begin, other.begin
+        if begin != other_begin:
+            return begin < other_begin
+        end, other_end = self.end, other.end
+        if end != other_end:
+            return end < other_end
+        return _type_sort_key(type(self)) < _type_sort_key(type(other))
 
     @property
     def text(self):
@@ -234,8 +248,8 @@ class Link(BaseLink):
         # These attributes are used to store values of parent
         # and child type in data store and must thus be in a
         # primitive form.
-        self.parent_type = get_full_module_name(self.ParentType)
-        self.child_type = get_full_module_name(self.ChildType)
+        self.parent_type = _type_name(self.ParentType)
+        self.child_type = _type_name(self.ChildType)
         super().__init__(pack, parent, child)
 
     # TODO: Can we get better type hint here?
@@ -318,7 +332,7 @@ class Group(BaseGroup[Entry]):
 
         # These attributes are used to store values of member type
         # in data store and must thus be in a primitive form.
-        self.member_type = get_full_module_name(self.MemberType)
+        self.member_type = _type_name(self.MemberType)
         super().__init__(pack, members)
 
     def add_member(self, member: Entry):
@@ -384,8 +398,8 @@ class MultiPackLink(MultiEntry, BaseLink):
         # These attributes are used to store values of parent
         # and child type in data store and must thus be in a
         # primitive form.
-        self.parent_type = get_full_module_name(self.ParentType)
-        self.child_type = get_full_module_name(self.ChildType)
+        self.parent_type = _type_name(self.ParentType)
+        self.child_type = _type_name(self.ChildType)
         super().__init__(pack, parent, child)
 
     def parent_id(self) -> int:
@@ -415,7 +429,7 @@ class MultiPackLink(MultiEntry, BaseLink):
         """
         if self.parent[0] is None:
             raise ValueError("Parent is not set for this link.")
-        return self.pack.packs[self.parent[0]].pack_id
+        return self._to_pack_id(self.parent[0])
 
     def child_pack_id(self) -> int:
         """
@@ -426,7 +440,19 @@ class MultiPackLink(MultiEntry, BaseLink):
         """
         if self.child[0] is None:
             raise ValueError("Child is not set for this link.")
-        return self.pack.packs[self.child[0]].pack_id
+        return self._to_pack_id(self.child[0])
+
+    def _to_pack_id(self, pack_idx: int) -> int:
+        # pylint: disable=import-outside-toplevel
+        from forte.data.multi_pack import version_indexed_by_pack_id
+
+        # Packs written before ``version_indexed_by_pack_id`` store the index
+        # of the pack in the multi pack instead of its ``pack_id``.
+        if Version(self.pack.pack_version) < Version(
+            version_indexed_by_pack_id
+        ):
+            return self.pack.packs[pack_idx].pack_id
+        return pack_idx
 
     def set_parent(self, parent: Entry):
         r"""This will set the `parent` of the current instance with given Entry.
@@ -511,7 +537,7 @@ class MultiPackGroup(MultiEntry, BaseGroup[Entry]):
 
         # These attributes are used to store values of member type
         # in data store and must thus be in a primitive form.
-        self.member_type = get_full_module_name(self.MemberType)
+        self.member_type = _type_name(self.MemberType)
         super().__init__(pack)
 
         if members is not None:
@@ -566,6 +592,19 @@ class Query(Generics):
         """
         self.results.update(pid_to_score)
 
+    def top_k(self, k: int) -> List[Tuple[str, float]]:
+        r"""Get the `k` results with the highest scores. This uses a bounded
+        heap, so it is cheaper than sorting all the results when `k` is much
+        smaller than the number of results.
+
+        Args:
+            k: The number of results to return.
+
+        Returns:
+            A list of (pack id, score) pairs sorted by descending score.
+        """
+        return heapq.nlargest(k, self.results.items(), key=itemgetter(1))
+
 
 @dataclass
 @total_ordering
@@ -587,7 +626,6 @@ class AudioAnnotation(Entry):
 
     def __init__(self, pack: PackType, begin: int, end: int):
 
-        self._span: Optional[Span] = None
         self.begin: int = begin
         self.end: int = end
         super().__init__(pack)
@@ -603,10 +641,8 @@ class AudioAnnotation(Entry):
 
     @property
     def span(self) -> Span:
-        # Delay span creation at usage.
-        if self._span is None:
-            self._span = Span(self.begin, self.end)
-        return self._span
+        # Built on access so that it always reflects the stored offsets.
+        return Span(self.begin, self.end)
 
     def __eq__(self, other):
         r"""The eq function of :class:`AudioAnnotation`.
@@ -616,13 +652,9 @@ class AudioAnnotation(Entry):
         Users can define their own eq function by themselves but this must
         be consistent to :meth:`hash`.
         """
-        if other is None:
+        if other is None or type(self) is not type(other):
             return False
-        return (type(self), self.begin, self.end) == (
-            type(other),
-            other.begin,
-            other.end,
-        )
+        return self.begin == other.begin and self.end == other.end
 
     def __lt__(self, other):
         r"""To support total_ordering, `AudioAnnotation` must implement
@@ -635,12 +667,14 @@ class AudioAnnotation(Entry):
         3. In the case where both offsets are the same, we break the tie using
            the normal sorting of the class name.
         """
-        if self.begin == other.begin:
-            if self.end == other.end:
-                return str(type(self)) < str(type(other))
-            return self.end < other.end
-        else:
-            return self.begin < other.begin
+        # The offsets live in the data store, so read each of them only once.
+        begin, other_begin = self.begin, other.begin
+        if begin != other_begin:
+            return begin < other_begin
+        end, other_end = self.end, other.end
+        if end != other_end:
+            return end < other_end
+        return _type_sort_key(type(self)) < _type_sort_key(type(other))
 
     @property
     def index_key(self) -> int:
@@ -689,23 +723,33 @@ class ImageAnnotation(Entry):
                 If it's not set, it defaults to 0 which means it will load the
                 first image payload.
         """
-        self._image_payload_idx = image_payload_idx
+        self._image_payload_idx = (
+            0 if image_payload_idx is None else image_payload_idx
+        )
+        # The payload entry is looked up lazily and kept, its ``cache`` is
+        # still read on every access so that updated images are seen.
+        self._image_payload: Optional[Payload] = None
         super().__init__(pack)
 
     @property
     def image_payload_idx(self) -> int:
         return self._image_payload_idx
 
+    def _get_image_payload(self) -> "Payload":
+        if self._image_payload is None:
+            if self.pack is None:
+                raise ValueError(
+                    "Cannot get image because image annotation is not "
+                    "attached to any data pack."
+                )
+            self._image_payload = self.pack.get_payload_at(
+                Modality.Image, self._image_payload_idx
+            )
+        return self._image_payload
+
     @property
     def image(self):
-        if self.pack is None:
-            raise ValueError(
-                "Cannot get image because image annotation is not "
-                "attached to any data pack."
-            )
-        return self.pack.get_payload_data_at(
-            Modality.Image, self._image_payload_idx
-        )
+        return self._get_image_payload().cache
 
     @property
     def max_x(self):
@@ -729,14 +773,7 @@ class ImageAnnotation(Entry):
         Returns:
             The shape of the image.
         """
-        if self.pack is None:
-            raise ValueError(
-                "Cannot get image because image annotation is not "
-                "attached to any data pack."
-            )
-        image_shape = self.pack.get_payload_at(
-            Modality.Image, self._image_payload_idx
-        ).cache_shape
+        image_shape = self._get_image_payload().cache_shape
         if not 2 <= len(image_shape) <= 3:
             raise ValueError(
                 "Image shape is not valid."
@@ -745,10 +782,12 @@ class ImageAnnotation(Entry):
             )
         return image_shape
 
-    def __eq__(self, other):
-        if other is None:
-            return False
-        return self.image_payload_idx == other.image_payload_idx
+    # ``dataclass`` would generate an ``__eq__`` over the (empty) fields and
+    # drop the hash. Image annotations without geometry, such as ``Region``,
+    # keep the type and ``tid`` based comparison of ``Entry``. Subclasses
+    # with geometry, such as ``Box``, define their own.
+    __eq__ = Entry.__eq__
+    __hash__ = Entry.__hash__
 
 
 class Region(ImageAnnotation):
@@ -763,16 +802,24 @@ class Region(ImageAnnotation):
             it defaults to 0 which meaning it will load the first image payload.
     """
 
-    def __init__(self, pack: PackType, image_payload_idx: int = 0):
+    # Kept because the ontology code generator reads ``__init__`` of each class.
+    def __init__(  # pylint: disable=useless-super-delegation
+        self, pack: PackType, image_payload_idx: int = 0
+    ):
         super().__init__(pack, image_payload_idx)
-        if image_payload_idx is None:
-            self._image_payload_idx = 0
-        else:
-            self._image_payload_idx = image_payload_idx
 
     def compute_iou(self, other) -> float:
-        intersection = np.sum(np.logical_and(self.image, other.image))
-        union = np.sum(np.logical_or(self.image, other.image))
+        image, other_image = self.image, other.image
+        # Only the intersection needs a temporary mask, the union follows
+        # from the two foreground counts.
+        intersection = np.count_nonzero(np.logical_and(image, other_image))
+        union = (
+            np.count_nonzero(image)
+            + np.count_nonzero(other_image)
+            - intersection
+        )
+        if union == 0:
+            return 0.0
         return intersection / union
 
 
@@ -802,6 +849,22 @@ class Box(Region):
         image_payload_idx: int = 0,
     ):
         super().__init__(pack, image_payload_idx)
+        y0, x0 = tl_point
+        y1, x1 = br_point
+        # A valid box passes this single check, the individual conditions
+        # are only evaluated to build the error message.
+        if not (0 <= y0 < y1 and 0 <= x0 < x1):
+            self._raise_invalid_corners(tl_point, br_point)
+
+        self._y0, self._x0 = y0, x0
+        self._y1, self._x1 = y1, x1
+        self._cy = round((self._y0 + self._y1) / 2)
+        self._cx = round((self._x0 + self._x1) / 2)
+        self._height = self._y1 - self._y0
+        self._width = self._x1 - self._x0
+
+    @staticmethod
+    def _raise_invalid_corners(tl_point: List[int], br_point: List[int]):
         if tl_point[0] < 0 or tl_point[1] < 0:
             raise ValueError(
                 f"input parameter top left point indices ({tl_point}) must"
@@ -817,18 +880,10 @@ class Box(Region):
                 f"top left point y coordinate({tl_point[0]}) must be less than"
                 f" bottom right y coordinate({br_point[0]})"
             )
-        if tl_point[1] >= br_point[1]:
-            raise ValueError(
-                f"top left point x coordinate({tl_point[1]}) must be less than"
-                f" bottom right x coordinate({br_point[1]})"
-            )
-
-        self._y0, self._x0 = tl_point
-        self._y1, self._x1 = br_point
-        self._cy = round((self._y0 + self._y1) / 2)
-        self._cx = round((self._x0 + self._x1) / 2)
-        self._height = self._y1 - self._y0
-        self._width = self._x1 - self._x0
+        raise ValueError(
+            f"top left point x coordinate({tl_point[1]}) must be less than"
+            f" bottom right x coordinate({br_point[1]})"
+        )
 
     @classmethod
     def init_from_center_n_shape(
@@ -888,20 +943,105 @@ class Box(Region):
                 "You need to check the type of the other object."
             )
 
-        if not self.is_overlapped(other):
-            return 0
-        box_x_diff = min(
-            abs(other.box_max_x - self.box_min_x),
-            abs(other.box_min_x - self.box_max_x),
-        )
-        box_y_diff = min(
-            abs(other.box_max_y - self.box_min_y),
-            abs(other.box_min_y - self.box_max_y),
-        )
-        intersection = box_x_diff * box_y_diff
+        # ``corners`` gives the corners unclipped, unlike ``box_max_*``.
+        (oy0, ox0), _, _, (oy1, ox1) = other.corners
+        inter_h = min(self._y1, oy1) - max(self._y0, oy0)
+        inter_w = min(self._x1, ox1) - max(self._x0, ox0)
+        if inter_h <= 0 or inter_w <= 0:
+            return 0.0
+        intersection = inter_h * inter_w
         union = self.area + other.area - intersection
         return intersection / union
 
+    @staticmethod
+    def _corner_array(
+        boxes: Sequence["Box"], clip_to_image: bool = False
+    ) -> np.ndarray:
+        # Each row is [y0, x0, y1, x1] of one box. With ``clip_to_image`` the
+        # bottom right corner is clipped like ``box_max_y`` and ``box_max_x``.
+        corners = []
+        for b in boxes:
+            (y0, x0), _, _, (y1, x1) = b.corners
+            if clip_to_image:
+                height, width = b.image_shape[:2]
+                y1, x1 = min(y1, height - 1), min(x1, width - 1)
+            corners.append((y0, x0, y1, x1))
+        return np.array(corners, dtype=np.int64).reshape(-1, 4)
+
+    @staticmethod
+    def compute_iou_batch(
+        boxes: Sequence["Box"], others: Sequence["Box"]
+    ) -> np.ndarray:
+        """
+        A function computes iou(intersection over union) between every pair
+        of boxes from two groups (unit: pixel). The coordinates are gathered
+        into arrays once and all the pairs are computed with broadcasting,
+        which is much faster than calling ``compute_iou`` pair by pair.
+
+        Args:
+            boxes: the first group of ``Box`` objects.
+            others: the second group of ``Box`` objects.
+
+        Returns:
+            A float array of shape ``[len(boxes), len(others)]`` where the
+            element at ``[i, j]`` is the iou between ``boxes[i]`` and
+            ``others[j]``.
+        """
+        y0, x0, y1, x1 = Box._corner_array(boxes).T[:, :, None]
+        oy0, ox0, oy1, ox1 = Box._corner_array(others).T[:, None, :]
+
+        inter_h = np.clip(np.minimum(y1, oy1) - np.maximum(y0, oy0), 0, None)
+        inter_w = np.clip(np.minimum(x1, ox1) - np.maximum(x0, ox0), 0, None)
+        intersection = inter_h * inter_w
+        union = (y1 - y0) * (x1 - x0) + (oy1 - oy0) * (ox1 - ox0) - intersection
+        return intersection / union
+
+    @staticmethod
+    def is_overlapped_batch(
+        boxes: Sequence["Box"], others: Sequence["Box"]
+    ) -> np.ndarray:
+        """
+        A function checks whether every pair of boxes from two groups are
+        overlapped, with the same rule as ``is_overlapped``. The coordinates
+        are gathered into arrays once and all the pairs are compared with
+        broadcasting.
+
+        Args:
+            boxes: the first group of ``Box`` objects.
+            others: the second group of ``Box`` objects.
+
+        Returns:
+            A boolean array of shape ``[len(boxes), len(others)]`` where the
+            element at ``[i, j]`` indicates whether ``boxes[i]`` and
+            ``others[j]`` are overlapped.
+        """
+        y0, x0, y1, x1 = Box._corner_array(boxes, True).T[:, :, None]
+        oy0, ox0, oy1, ox1 = Box._corner_array(others, True).T[:, None, :]
+        return ~((x0 > ox1) | (ox0 > x1) | (y0 > oy1) | (oy0 > y1))
+
+    def __eq__(self, other):
+        r"""The eq function of :class:`Box`. Two boxes are regarded as the
+        same if they are on the same image payload and have the same corners.
+        """
+        if other is None or type(self) is not type(other):
+            return False
+        return (self.image_payload_idx, self.corners) == (
+            other.image_payload_idx,
+            other.corners,
+        )
+
+    def __hash__(self):
+        return hash(
+            (
+                type(self),
+                self._image_payload_idx,
+                self._y0,
+                self._x0,
+                self._y1,
+                self._x1,
+            )
+        )
+
     @property
     def center(self):
         return (self._cy, self._cx)
@@ -953,14 +1093,38 @@ class Box(Region):
         Returns:
             A boolean value indicating whether there is overlapped.
         """
-        # If one box is on left side of other
-        if self.box_min_x > other.box_max_x or other.box_min_x > self.box_max_x:
-            return False
+        # Same as comparing ``box_min_*`` and ``box_max_*`` of the two boxes,
+        # but each image shape is only looked up once.
+        height, width = self.image_shape[:2]
+        other_height, other_width = other.image_shape[:2]
+        (other_y0, other_x0), _, _, (other_y1, other_x1) = other.corners
+        x1, y1 = min(self._x1, width - 1), min(self._y1, height - 1)
+        other_x1 = min(other_x1, other_width - 1)
+        other_y1 = min(other_y1, other_height - 1)
+
+        # Overlapped unless one box is on the left side of or above the other.
+        return not (
+            self._x0 > other_x1
+            or other_x0 > x1
+            or self._y0 > other_y1
+            or other_y0 > y1
+        )
 
-        # If one box is above other
-        if self.box_min_y > other.box_max_y or other.box_min_y > self.box_max_y:
-            return False
-        return True
+
+def _encode_array(array: np.ndarray) -> Dict[str, str]:
+    # Store the array in the binary ``.npy`` format, which keeps its dtype
+    # and shape and avoids building one Python object per element.
+    buffer = io.BytesIO()
+    np.save(buffer, array, allow_pickle=False)
+    return {"__npy__": base64.b64encode(buffer.getvalue()).decode("ascii")}
+
+
+def _decode_array(value: Union[Dict[str, str], List]) -> np.ndarray:
+    if isinstance(value, dict):
+        return np.load(
+            io.BytesIO(base64.b64decode(value["__npy__"])), allow_pickle=False
+        )
+    return np.array(value)
 
 
 @dataclass
@@ -1066,6 +1230,7 @@ class Payload(Entry):
     def uri(self, url: Optional[Union[str, Path, URL]]):
         self._uri = url
 
+    @property
     def cache_shape(self) -> Optional[Sequence[int]]:
         return self._cache_shape
 
@@ -1082,10 +1247,9 @@ class Payload(Entry):
         state["modality"] = self.modality.name
         state.pop("_Entry__pack")
 
-        if isinstance(state["_cache"], np.ndarray):
-            state["_cache"] = list(self._cache.tolist())
-        if isinstance(state["_embedding"], np.ndarray):
-            state["_embedding"] = list(self._embedding.tolist())
+        for key in ("_cache", "_embedding"):
+            if isinstance(state[key], np.ndarray):
+                state[key] = _encode_array(state[key])
 
         return state
 
@@ -1098,19 +1262,20 @@ class Payload(Entry):
         self.__dict__.update(state)
         self.modality = getattr(Modality, state["modality"])
 
-        # During de-serialization, convert the list back to numpy array.
+        # During de-serialization, convert the arrays back to numpy. Older
+        # packs stored them as (nested) lists.
         if "_embedding" in state:
-            state["_embedding"] = np.array(state["_embedding"])
+            self._embedding = _decode_array(state["_embedding"])
         else:
-            state["_embedding"] = np.empty(0)
+            self._embedding = np.empty(0)
 
         # Here we assume that if the payload is not text (in which case
         # cache is stored a string), cache will always be stored as a
-        # numpy array (which is converted to a list during serialization).
+        # numpy array (which is encoded during serialization).
         # This check can be made more comprehensive when new types of
         # payloads are introduced.
-        if "_cache" in state and isinstance(state["_cache"], list):
-            state["_cache"] = np.array(state["_cache"])
+        if "_cache" in state and isinstance(state["_cache"], (list, dict)):
+            self._cache = _decode_array(state["_cache"])
 
 
 @dataclass
@@ -34,6 +34,8 @@ class Span:
             span is a left-closed and right-open interval ``[begin, end)``.
     """
 
+    __slots__ = ("begin", "end")
+
     def __init__(self, begin: int, end: int):
         if not isinstance(begin, int) or not isinstance(end, int):
             raise ValueError(
@@ -67,8 +69,10 @@ class Span:
         return hash((self.begin, self.end))
 
     def __getstate__(self):
-        state = self.__dict__.copy()
-        return state
+        return {"begin": self.begin, "end": self.end}
 
     def __setstate__(self, state):
-        self.__dict__.update(state)
+        # Also accepts the ``__dict__`` state of spans pickled before
+        # ``Span`` used slots.
+        self.begin = state["begin"]
+        self.end = state["end"]
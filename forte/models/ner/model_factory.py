@@ -150,7 +150,9 @@ class BiRecurrentConvCRF(nn.Module):
             input_word, input_char, mask=mask, hx=hx
         )
 
-        logits = self.tag_projection_layer(output)
+        # The Viterbi decoding is done in float32 even if the forward pass
+        # runs under reduced precision autocast.
+        logits = self.tag_projection_layer(output).float()
         best_paths = self.crf.viterbi_tags(logits, mask.long())
         predicted_tags = [x for x, y in best_paths]
         predicted_tags = [torch.tensor(x).unsqueeze(0) for x in predicted_tags]
@@ -25,8 +25,12 @@ from typing import (
     Tuple,
     Dict,
     Any,
+    Optional,
+    Type,
+    Union,
 )
 from abc import abstractmethod
+from forte.common.configuration import Config
 from forte.data.data_pack import DataPack
 from forte.data.ontology.top import Annotation
 from forte.utils.utils import get_class
@@ -53,6 +57,11 @@ class SingleAnnotationAugmentOp(BaseDataAugmentationOp):
     predefined type) undergo.
     """
 
+    def __init__(self, configs: Union[Config, Dict[str, Any]]):
+        super().__init__(configs)
+        # The class of ``augment_entry``, resolved on the first ``augment``.
+        self._augment_entry: Optional[Type[Annotation]] = None
+
     def augment(self, data_pack: DataPack) -> bool:
         r"""
         This method is not to be modified when using
@@ -67,7 +76,9 @@ class SingleAnnotationAugmentOp(BaseDataAugmentationOp):
             A boolean value indicating if the augmentation
             was successful (True) or unsuccessful (False).
         """
-        augment_entry = get_class(self.configs["augment_entry"])
+        if self._augment_entry is None:
+            self._augment_entry = get_class(self.configs["augment_entry"])
+        augment_entry = self._augment_entry
         anno: Annotation
         replaced_text: str
         is_replace: bool
@@ -16,8 +16,7 @@ This Processor focuses on calling data augmentation ops
 to generate texts similar to those in the input pack
 and create a new pack with them.
 """
-from collections import defaultdict
-from typing import List, Tuple, Dict, DefaultDict, Union, cast
+from typing import List, Tuple, Dict, Optional, Union, cast
 from forte.common.configuration import Config
 from forte.common.resources import Resources
 from forte.data.data_pack import DataPack
@@ -52,7 +51,7 @@ class DataAugProcessor(MultiPackProcessor):
         # :attr:`_new_data_packs`: {datapack id: datapack}
         # It records the mapping from the original data pack
         # to the augmented data pack
-        self._new_data_packs: DefaultDict[int, DataPack] = defaultdict()
+        self._new_data_packs: Dict[int, DataPack] = {}
 
         # :attr:`_data_pack_map`: {orig pack id: new pack id}
         # It maintains a mapping from the pack id
@@ -79,7 +78,10 @@ class DataAugProcessor(MultiPackProcessor):
         self.configs = self.make_configs(configs)
 
     def _copy_multi_pack_link_or_group(
-        self, entry: Union[MultiPackLink, MultiPackGroup], multi_pack: MultiPack
+        self,
+        entry: Union[MultiPackLink, MultiPackGroup],
+        multi_pack: MultiPack,
+        new_pack_cache: Optional[Dict[int, DataPack]] = None,
     ) -> bool:
         r"""
         This function copies a MultiPackLink/MultiPackGroup in the multipack.
@@ -89,6 +91,9 @@ class DataAugProcessor(MultiPackProcessor):
         Args:
             entry: The MultiPackLink/MultiPackGroup to copy.
             multi_pack: The multi_pack contains the input entry.
+            new_pack_cache: An optional dictionary from the original pack id
+                to the new data pack, shared across the calls for one
+                multi pack so that each new pack is only resolved once.
 
         Returns:
             A bool value indicating whether the copy happens.
@@ -106,21 +111,30 @@ class DataAugProcessor(MultiPackProcessor):
         for child_entry in children:
             child_pack: DataPack = child_entry.pack
             child_pack_pid: int = child_pack.pack_id
+            new_pack_pid: Optional[int] = self._data_pack_map.get(
+                child_pack_pid
+            )
+            entry_map: Optional[Dict[int, int]] = self._entry_maps.get(
+                child_pack_pid
+            )
             # The new pack should be present.
-            if (
-                child_pack_pid not in self._data_pack_map
-                or child_pack_pid not in self._entry_maps
-            ):
+            if new_pack_pid is None or entry_map is None:
                 return False
-            new_child_pack: DataPack = multi_pack.get_pack_at(
-                multi_pack.get_pack_index(self._data_pack_map[child_pack_pid])
-            )
             # The new child entry should be present.
-            if child_entry.tid not in self._entry_maps[child_pack_pid]:
+            new_child_tid: Optional[int] = entry_map.get(child_entry.tid)
+            if new_child_tid is None:
                 return False
-            new_child_tid: int = self._entry_maps[child_pack_pid][
-                child_entry.tid
-            ]
+            new_child_pack: Optional[DataPack] = (
+                None
+                if new_pack_cache is None
+                else new_pack_cache.get(child_pack_pid)
+            )
+            if new_child_pack is None:
+                new_child_pack = multi_pack.get_pack_at(
+                    multi_pack.get_pack_index(new_pack_pid)
+                )
+                if new_pack_cache is not None:
+                    new_pack_cache[child_pack_pid] = new_child_pack
             new_child_entry: Entry = new_child_pack.get_entry(new_child_tid)
             new_children.append(new_child_entry)
 
@@ -146,6 +160,7 @@ class DataAugProcessor(MultiPackProcessor):
         called after processing a multipack.
         """
         self.replacement_op.clear_states()
+        self._new_data_packs.clear()
         self._data_pack_map.clear()
         self._entry_maps.clear()
 
@@ -188,16 +203,20 @@ class DataAugProcessor(MultiPackProcessor):
 
     def _process(self, input_pack: MultiPack):
         # Get the pack names for augmentation.
-        aug_pack_names: List[str] = []
-
-        # Check if the DataPack exists.
-        for pack_name in self.configs["augment_pack_names"].keys():
-            if pack_name in input_pack.pack_names:
-                aug_pack_names.append(pack_name)
+        augment_pack_names = self.configs["augment_pack_names"]
+        aug_pack_names: List[str]
 
-        if len(self.configs["augment_pack_names"].keys()) == 0:
+        if len(augment_pack_names) == 0:
             # Augment all the DataPacks if not specified.
             aug_pack_names = list(input_pack.pack_names)
+        else:
+            # Check if the DataPack exists.
+            existing_pack_names = set(input_pack.pack_names)
+            aug_pack_names = [
+                pack_name
+                for pack_name in augment_pack_names.keys()
+                if pack_name in existing_pack_names
+            ]
 
         success = self._augment(input_pack, aug_pack_names)
 
@@ -210,7 +229,7 @@ class DataAugProcessor(MultiPackProcessor):
         new_packs: List[Tuple[str, DataPack]] = []
 
         for aug_pack_name in aug_pack_names:
-            new_pack_name: str = self.configs["augment_pack_names"].get(
+            new_pack_name: str = augment_pack_names.get(
                 aug_pack_name, "augmented_" + aug_pack_name
             )
             data_pack = input_pack.get_pack(aug_pack_name)
@@ -223,10 +242,11 @@ class DataAugProcessor(MultiPackProcessor):
             input_pack.add_pack_(new_pack, new_pack_name)
 
         # Copy the MultiPackLinks/MultiPackGroups
+        new_pack_cache: Dict[int, DataPack] = {}
         for mpl in input_pack.get(MultiPackLink):
-            self._copy_multi_pack_link_or_group(mpl, input_pack)
+            self._copy_multi_pack_link_or_group(mpl, input_pack, new_pack_cache)
         for mpg in input_pack.get(MultiPackGroup):
-            self._copy_multi_pack_link_or_group(mpg, input_pack)
+            self._copy_multi_pack_link_or_group(mpg, input_pack, new_pack_cache)
 
         # Must be called after processing each multipack
         # to reset internal states.
@@ -11,8 +11,6 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import re
-
 from ft.onto.base_ontology import Sentence, Token
 from forte.data import DataPack
 from forte.processors.base import PackProcessor
@@ -26,18 +24,24 @@ class PeriodSentenceSplitter(PackProcessor):
     """
 
     def _process(self, input_pack: DataPack):
-        pattern = "\\.\\s*"
+        text = input_pack.text
+        length = len(text)
+        add_entry = input_pack.add_entry
         start = 0
 
-        for m in re.finditer(pattern, input_pack.text):
-            end = m.end()
-            Sentence(input_pack, start, end)
+        # Each sentence ends after a period and the white spaces following
+        # it, ``str.find`` locates the periods without the regex engine.
+        period = text.find(".")
+        while period != -1:
+            end = period + 1
+            while end < length and text[end].isspace():
+                end += 1
+            add_entry(Sentence(input_pack, start, end))
             start = end
+            period = text.find(".", end)
 
-        if start < len(input_pack.text):
-            input_pack.add_entry(
-                Sentence(input_pack, start, len(input_pack.text))
-            )
+        if start < length:
+            add_entry(Sentence(input_pack, start, length))
 
 
 class WhiteSpaceTokenizer(PackProcessor):
@@ -46,12 +50,13 @@ class WhiteSpaceTokenizer(PackProcessor):
     """
 
     def _process(self, input_pack: DataPack):
-        pattern = r"\s+"
-        start = 0
-
-        for m in re.finditer(pattern, input_pack.text):
-            input_pack.add_entry(Token(input_pack, start, m.start()))
-            start = m.end()
-
-        if start < len(input_pack.text):
-            input_pack.add_entry(Token(input_pack, start, len(input_pack.text)))
+        text = input_pack.text
+        add_entry = input_pack.add_entry
+        end = 0
+
+        # ``str.split`` splits on the same white spaces as ``\s``, each word
+        # is then located right after the end of the previous one.
+        for word in text.split():
+            begin = text.index(word, end)
+            end = begin + len(word)
+            add_entry(Token(input_pack, begin, end))
@@ -15,6 +15,7 @@
 # pylint: disable=logging-fstring-interpolation
 import logging
 import os
+from contextlib import nullcontext
 from typing import Dict, List, Optional, Tuple
 import numpy as np
 
@@ -36,6 +37,9 @@ except ImportError as e:
         create_import_error_msg("torch", "models", "ner predictor")
     ) from e
 
+# ``torch.inference_mode`` skips the autograd bookkeeping (version counters,
+# view tracking) that ``torch.no_grad`` still does, but needs torch>=1.9.
+_inference_mode = getattr(torch, "inference_mode", torch.no_grad)
 
 logger = logging.getLogger(__name__)
 
@@ -68,10 +72,52 @@ class CoNLLNERPredictor(RequestPackingProcessor):
         self.config_data = None
         self.normalize_func = None
         self.device = None
+        self._word_ids_cache: Dict[str, Tuple[int, List[int]]] = {}
+        self._word_ids_cache_size = 100000
+        self._ner_labels: np.ndarray = np.array([])
+        self._use_bf16 = False
 
     def initialize(self, resources: Resources, configs: Config):
         super().initialize(resources, configs)
 
+        if resources.get("device"):
+            self.device = resources.get("device")
+        else:
+            self.device = (
+                torch.device("cuda")
+                if torch.cuda.is_available()
+                else torch.device("cpu")
+            )
+
+        # Check the dtype before loading any resources, so that an unusable
+        # setting fails here instead of at predict time.
+        if configs.dtype not in ("float32", "bfloat16"):
+            raise ProcessorConfigError(
+                f"Unsupported dtype [{configs.dtype}] for the NER predictor, "
+                "it should be either `float32` or `bfloat16`."
+            )
+        self._use_bf16 = False
+        if configs.dtype == "bfloat16":
+            if self.device.type != "cuda":
+                logger.warning(
+                    "The `bfloat16` dtype of the NER predictor only applies "
+                    "on GPU, the model runs in float32 on %s.",
+                    self.device,
+                )
+            elif not hasattr(torch, "autocast"):
+                raise ProcessorConfigError(
+                    "The `bfloat16` dtype of the NER predictor requires "
+                    "torch.autocast, which is only available from torch 1.10, "
+                    f"but torch {torch.__version__} is installed."
+                )
+            elif not torch.cuda.is_bf16_supported():
+                raise ProcessorConfigError(
+                    "The `bfloat16` dtype of the NER predictor is not "
+                    "supported by the current CUDA device."
+                )
+            else:
+                self._use_bf16 = True
+
         self.resource = resources
         self.config_model = configs.config_model
         self.config_data = configs.config_data
@@ -92,18 +138,17 @@ class CoNLLNERPredictor(RequestPackingProcessor):
         self.word_alphabet = resources.get("word_alphabet")
         self.char_alphabet = resources.get("char_alphabet")
         self.ner_alphabet = resources.get("ner_alphabet")
-        word_embedding_table = resources.get("word_embedding_table")
-
-        if resources.get("device"):
-            self.device = resources.get("device")
-        else:
-            self.device = (
-                torch.device("cuda")
-                if torch.cuda.is_available()
-                else torch.device("cpu")
+        if self.ner_alphabet is not None:
+            self._ner_labels = np.array(
+                [
+                    self.ner_alphabet.get_instance(i)
+                    for i in range(self.ner_alphabet.size())
+                ]
             )
+        word_embedding_table = resources.get("word_embedding_table")
 
         self.normalize_func = utils.normalize_digit_word
+        self._word_ids_cache.clear()
 
         if "model" not in self.resource.keys():
 
@@ -135,11 +180,16 @@ class CoNLLNERPredictor(RequestPackingProcessor):
 
         self.model = resources.get("model")
         self.model.to(self.device)
+        if configs.quantize and self.device.type == "cpu":
+            # Dynamic quantization only has CPU kernels.
+            self.model = torch.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
         self.model.eval()
 
         utils.set_random_seed(self.config_model.random_seed)
 
-    @torch.no_grad()
+    @_inference_mode()
     def predict(
         self, data_batch: Dict[str, Dict[str, List[str]]]
     ) -> Dict[str, Dict[str, List[np.ndarray]]]:
@@ -173,36 +223,57 @@ class CoNLLNERPredictor(RequestPackingProcessor):
             char_id_seqs = []
             word_ids = []
             for word in words:
-                char_ids = []
-                for char in word:
-                    char_ids.append(self.char_alphabet.get_index(char))
-                if len(char_ids) > self.config_data.max_char_length:
-                    char_ids = char_ids[: self.config_data.max_char_length]
+                word_id, char_ids = self._get_word_ids(word)
                 char_id_seqs.append(char_ids)
-
-                word = self.normalize_func(word)
-                word_ids.append(self.word_alphabet.get_index(word))
+                word_ids.append(word_id)
 
             instances.append((word_ids, char_id_seqs))
 
         self.model.eval()
         batch_data = self.get_batch_tensor(instances, device=self.device)
         word, char, masks, unused_lengths = batch_data
-        preds = self.model.decode(word, char, mask=masks)
+        with (
+            torch.autocast("cuda", dtype=torch.bfloat16)
+            if self._use_bf16
+            else nullcontext()
+        ):
+            preds = self.model.decode(word, char, mask=masks)
+        # Copy the decoded tags to host memory once, then map the tag ids of
+        # each sentence to labels with a single fancy-indexing operation.
+        preds = preds.cpu().numpy()
 
         pred: Dict = {"Token": {"ner": [], "tid": []}}
 
         for i in range(len(tokens["tid"])):
             tids = tokens["tid"][i]
-            ner_tags = []
-            for j in range(len(tids)):
-                ner_tags.append(self.ner_alphabet.get_instance(preds[i][j]))
-
-            pred["Token"]["ner"].append(np.array(ner_tags))
+            pred["Token"]["ner"].append(self._ner_labels[preds[i, : len(tids)]])
             pred["Token"]["tid"].append(np.array(tids))
 
         return pred
 
+    def _get_word_ids(self, word: str) -> Tuple[int, List[int]]:
+        """
+        Map a word to its word id and character ids. The mapping only
+        depends on the word text, so the results are cached: words repeat
+        a lot across sentences and documents.
+        """
+        ids = self._word_ids_cache.get(word)
+        if ids is None:
+            char_ids = [
+                self.char_alphabet.get_index(char)  # type: ignore
+                for char in word[
+                    : self.config_data.max_char_length  # type: ignore
+                ]
+            ]
+            word_id = self.word_alphabet.get_index(  # type: ignore
+                self.normalize_func(word)  # type: ignore
+            )
+            ids = (word_id, char_ids)
+            if len(self._word_ids_cache) >= self._word_ids_cache_size:
+                self._word_ids_cache.clear()
+            self._word_ids_cache[word] = ids
+        return ids
+
     def load_model_checkpoint(self, model_path=None):
         if self.config_model is None:
             raise ProcessorConfigError(
@@ -349,17 +420,38 @@ class CoNLLNERPredictor(RequestPackingProcessor):
             cid_inputs[i, inst_size:, :] = self.char_alphabet.pad_id
             masks[i, :inst_size] = 1.0
 
-        words = torch.from_numpy(wid_inputs).to(device)
-        chars = torch.from_numpy(cid_inputs).to(device)
-        masks = torch.from_numpy(masks).to(device)
-        lengths = torch.from_numpy(lengths).to(device)
+        # Copies from page-locked memory to the GPU can run asynchronously.
+        pin = device is not None and device.type == "cuda"
+
+        def to_device(array: np.ndarray) -> torch.Tensor:
+            tensor = torch.from_numpy(array)
+            if pin:
+                return tensor.pin_memory().to(device, non_blocking=True)
+            return tensor.to(device)
+
+        words = to_device(wid_inputs)
+        chars = to_device(cid_inputs)
+        masks = to_device(masks)
+        lengths = to_device(lengths)
 
         return words, chars, masks, lengths
 
     # TODO: change this to manageable size
     @classmethod
     def default_configs(cls):
-        r"""Default config for NER Predictor"""
+        r"""Default config for NER Predictor.
+
+        Here:
+
+            - `quantize`: If True, the linear layers of the model are
+              dynamically quantized to int8 when running on CPU.
+            - `dtype`: The compute precision of the model on GPU, either
+              `float32` or `bfloat16`. With `bfloat16` the forward pass runs
+              under :func:`torch.autocast`, the weights stay in float32.
+              On GPU, `bfloat16` requires torch 1.10 or later and a device
+              with bfloat16 support. On other devices it is ignored with a
+              warning and the model runs in float32.
+        """
         return {
             "config_data": {
                 "train_path": "",
@@ -401,6 +493,8 @@ class CoNLLNERPredictor(RequestPackingProcessor):
                 "model_path": "",
                 "resource_dir": "",
             },
+            "quantize": False,
+            "dtype": "float32",
             "batcher": {
                 "batch_size": 16,
                 "context_type": "ft.onto.base_ontology.Sentence",
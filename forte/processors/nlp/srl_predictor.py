@@ -44,6 +44,8 @@ except ImportError as e:
         create_import_error_msg("torch", "nlp", "nlp processors")
     ) from e
 
+# Fall back to ``torch.no_grad`` for torch<1.9.
+_inference_mode = getattr(torch, "inference_mode", torch.no_grad)
 
 logger = logging.getLogger(__name__)
 
@@ -103,8 +105,19 @@ class SRLPredictor(RequestPackingProcessor):
                 map_location=self.device,
             )
         )
+        self.model = self.model.to(self.device)
+        if (
+            configs is not None
+            and configs.quantize
+            and self.device.type == "cpu"
+        ):
+            # Dynamic quantization only has CPU kernels.
+            self.model = torch.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
         self.model.eval()
 
+    @_inference_mode()
     def predict(self, data_batch: Dict) -> Dict[str, List[Prediction]]:
         text: List[List[str]] = [
             sentence.tolist() for sentence in data_batch["Token"]["text"]
@@ -125,7 +138,6 @@ class SRLPredictor(RequestPackingProcessor):
             length=length,
             srl=[[]] * batch_size,
         )
-        self.model = self.model.to(self.device)
         batch_srl_spans = self.model.decode(batch)
 
         # Convert predictions into annotations.
@@ -169,9 +181,16 @@ class SRLPredictor(RequestPackingProcessor):
     def default_configs(cls):
         """
         This defines the default configuration structure for the predictor.
+
+        Here:
+
+            - `storage_path`: The directory of the pretrained SRL model.
+            - `quantize`: If True, the linear layers of the model are
+              dynamically quantized to int8 when running on CPU.
         """
         return {
             "storage_path": None,
+            "quantize": False,
             "batcher": {
                 "batch_size": 4,
                 "context_type": "ft.onto.base_ontology.Sentence",
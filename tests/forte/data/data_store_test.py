@@ -19,6 +19,7 @@ import os
 import logging
 import unittest
 import copy
+from operator import itemgetter
 from forte.data.ontology.core import Entry, FList
 
 from ft.onto.base_ontology import Document, Sentence
@@ -118,156 +119,88 @@ class SingleMetricTest(MetricTest):
         self.value: Optional[float] = None
 
 
-class DataStoreTest(unittest.TestCase):
-    def setUp(self) -> None:
-        self.data_store = DataStore()
-        # attribute fields for Document and Sentence entries
-        self.reference_type_attributes = {
-            "ft.onto.base_ontology.Document": {
-                "attributes": {
-                    "begin": {"index": 2, "type": (type(None), (int,))},
-                    "end": {"index": 3, "type": (type(None), (int,))},
-                    "payload_idx": {"index": 4, "type": (type(None), (int,))},
-                    "document_class": {"index": 5, "type": (list, (str,))},
-                    "sentiment": {"index": 6, "type": (dict, (str, float))},
-                    "classifications": {
-                        "index": 7,
-                        "type": (FDict, (str, Classification)),
-                    },
-                },
-                "parent_class": set(),
-            },
-            "ft.onto.base_ontology.Sentence": {
-                "attributes": {
-                    "begin": {"index": 2, "type": (type(None), (int,))},
-                    "end": {"index": 3, "type": (type(None), (int,))},
-                    "payload_idx": {"index": 4, "type": (type(None), (int,))},
-                    "speaker": {
-                        "index": 5,
-                        "type": (Union, (str, type(None))),
-                    },
-                    "part_id": {
-                        "index": 6,
-                        "type": (Union, (int, type(None))),
-                    },
-                    "sentiment": {"index": 7, "type": (dict, (str, float))},
-                    "classification": {
-                        "index": 8,
-                        "type": (dict, (str, float)),
-                    },
-                    "classifications": {
-                        "index": 9,
-                        "type": (FDict, (str, Classification)),
-                    },
-                },
-                "parent_class": set(),
-            },
-            "forte.data.ontology.top.Annotation": {
-                "attributes": {
-                    "begin": {"index": 2, "type": (type(None), (int,))},
-                    "end": {"index": 3, "type": (type(None), (int,))},
-                    "payload_idx": {"index": 4, "type": (type(None), (int,))},
-                },
-                "parent_class": {"Entry"},
-            },
-        }
-
-        self.base_type_attributes = {
-            "forte.data.ontology.top.Generics": {"parent_class": {"Entry"}},
-            "forte.data.ontology.top.Link": {
-                "attributes": {
-                    "parent_type": {"type": (type(None), (str,)), "index": 2},
-                    "child_type": {"type": (type(None), (str,)), "index": 3},
-                    "parent": {"type": (Union, (int, type(None))), "index": 4},
-                    "child": {"type": (Union, (int, type(None))), "index": 5},
-                },
-                "parent_class": {"BaseLink"},
+# Attribute fields for the Document, Sentence and Annotation entries. Tests
+# must not modify it: DataStore updates the parent classes in place, so setUp
+# installs a deep copy.
+_REFERENCE_TYPE_ATTRIBUTES = {
+    "ft.onto.base_ontology.Document": {
+        "attributes": {
+            "begin": {"index": 2, "type": (type(None), (int,))},
+            "end": {"index": 3, "type": (type(None), (int,))},
+            "payload_idx": {"index": 4, "type": (type(None), (int,))},
+            "document_class": {"index": 5, "type": (list, (str,))},
+            "sentiment": {"index": 6, "type": (dict, (str, float))},
+            "classifications": {
+                "index": 7,
+                "type": (FDict, (str, Classification)),
             },
-            "forte.data.ontology.top.Group": {
-                "attributes": {
-                    "members": {"type": (list, (int,)), "index": 2},
-                    "member_type": {"type": (type(None), (str,)), "index": 3},
-                },
-                "parent_class": {"Entry", "BaseGroup"},
+        },
+        "parent_class": set(),
+    },
+    "ft.onto.base_ontology.Sentence": {
+        "attributes": {
+            "begin": {"index": 2, "type": (type(None), (int,))},
+            "end": {"index": 3, "type": (type(None), (int,))},
+            "payload_idx": {"index": 4, "type": (type(None), (int,))},
+            "speaker": {
+                "index": 5,
+                "type": (Union, (str, type(None))),
             },
-            "forte.data.ontology.top.MultiPackGeneric": {
-                "parent_class": {"Entry", "MultiEntry"}
+            "part_id": {
+                "index": 6,
+                "type": (Union, (int, type(None))),
             },
-            "forte.data.ontology.top.MultiPackLink": {
-                "attributes": {
-                    "parent_type": {"type": (type(None), (str,)), "index": 2},
-                    "child_type": {"type": (type(None), (str,)), "index": 3},
-                    "parent": {"type": (tuple, (Tuple,)), "index": 4},
-                    "child": {"type": (tuple, (Tuple,)), "index": 5},
-                },
-                "parent_class": {"MultiEntry", "BaseLink"},
+            "sentiment": {"index": 7, "type": (dict, (str, float))},
+            "classification": {
+                "index": 8,
+                "type": (dict, (str, float)),
             },
-            "forte.data.ontology.top.MultiPackGroup": {
-                "attributes": {
-                    "members": {"type": (list, (Tuple, int, int)), "index": 2},
-                    "member_type": {"type": (type(None), (str,)), "index": 3},
-                },
-                "parent_class": {"Entry", "MultiEntry", "BaseGroup"},
-            },
-            "forte.data.ontology.top.Query": {"parent_class": {"Generics"}},
-            "forte.data.ontology.top.AudioAnnotation": {
-                "attributes": {
-                    "begin": {"index": 2, "type": (type(None), (int,))},
-                    "end": {"index": 3, "type": (type(None), (int,))},
-                    "payload_idx": {"index": 4, "type": (type(None), (int,))},
-                },
-                "parent_class": {"Entry"},
+            "classifications": {
+                "index": 9,
+                "type": (FDict, (str, Classification)),
             },
-        }
+        },
+        "parent_class": set(),
+    },
+    "forte.data.ontology.top.Annotation": {
+        "attributes": {
+            "begin": {"index": 2, "type": (type(None), (int,))},
+            "end": {"index": 3, "type": (type(None), (int,))},
+            "payload_idx": {"index": 4, "type": (type(None), (int,))},
+        },
+        "parent_class": {"Entry"},
+    },
+}
+
+_ANNOTATION_ATTRIBUTES = _REFERENCE_TYPE_ATTRIBUTES[
+    "forte.data.ontology.top.Annotation"
+]["attributes"]
+# Annotation entries are sorted by (begin, end), as DataStore does.
+_ANNOTATION_SORTING_FN = itemgetter(
+    _ANNOTATION_ATTRIBUTES["begin"]["index"],
+    _ANNOTATION_ATTRIBUTES["end"]["index"],
+)
 
-        DataStore._type_attributes["ft.onto.base_ontology.Document"] = {
-            "attributes": {
-                "begin": {"index": 2, "type": (type(None), (int,))},
-                "end": {"index": 3, "type": (type(None), (int,))},
-                "payload_idx": {"index": 4, "type": (type(None), (int,))},
-                "document_class": {"index": 5, "type": (list, (str,))},
-                "sentiment": {"index": 6, "type": (dict, (str, float))},
-                "classifications": {
-                    "index": 7,
-                    "type": (FDict, (str, Classification)),
-                },
-            },
-            "parent_class": set(),
-        }
+# Locations of the non-annotation entries in the fixture, by tid.
+_TID_IDX_DICT = {
+    10123: ["forte.data.ontology.top.Group", 0],
+    23456: ["forte.data.ontology.top.Group", 1],
+    34567: ["forte.data.ontology.top.Group", 2],
+    88888: ["forte.data.ontology.top.Link", 0],
+}
 
-        DataStore._type_attributes["ft.onto.base_ontology.Sentence"] = {
-            "attributes": {
-                "begin": {"index": 2, "type": (type(None), (int,))},
-                "end": {"index": 3, "type": (type(None), (int,))},
-                "payload_idx": {"index": 4, "type": (type(None), (int,))},
-                "speaker": {
-                    "index": 5,
-                    "type": (Union, (str, type(None))),
-                },
-                "part_id": {
-                    "index": 6,
-                    "type": (Union, (int, type(None))),
-                },
-                "sentiment": {"index": 7, "type": (dict, (str, float))},
-                "classification": {
-                    "index": 8,
-                    "type": (dict, (str, float)),
-                },
-                "classifications": {
-                    "index": 9,
-                    "type": (FDict, (str, Classification)),
-                },
-            },
-            "parent_class": set(),
-        }
 
-        DataStore._type_attributes["forte.data.ontology.top.Annotation"] = {
-            "attributes": {
-                "begin": {"index": 2, "type": (type(None), (int,))},
-                "end": {"index": 3, "type": (type(None), (int,))},
-                "payload_idx": {"index": 4, "type": (type(None), (int,))},
-            },
-            "parent_class": {"Entry"},
+class DataStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.data_store = DataStore()
+        # Tests work on their own copy of the class-level type attributes,
+        # the original is put back once the test finishes.
+        self.addCleanup(
+            setattr, DataStore, "_type_attributes", DataStore._type_attributes
+        )
+        DataStore._type_attributes = {
+            **DataStore._type_attributes,
+            **copy.deepcopy(_REFERENCE_TYPE_ATTRIBUTES),
         }
         # The order is [Document, Sentence]. Initialize 2 entries in each list.
         # Document entries have tid 1234, 3456.
@@ -320,29 +253,17 @@ class DataStoreTest(unittest.TestCase):
         ]
         ref5 = [7654, "forte.data.ontology.top.Annotation", 10, 20, 0]
 
-        sorting_fn = lambda s: (
-            s[
-                self.reference_type_attributes[
-                    "forte.data.ontology.top.Annotation"
-                ]["attributes"]["begin"]["index"]
-            ],
-            s[
-                self.reference_type_attributes[
-                    "forte.data.ontology.top.Annotation"
-                ]["attributes"]["end"]["index"]
-            ],
-        )
         self.data_store._DataStore__elements = {
             "ft.onto.base_ontology.Document": SortedList(
-                [ref1, ref2], key=sorting_fn
+                [ref1, ref2], key=_ANNOTATION_SORTING_FN
             ),
             "ft.onto.base_ontology.Sentence": SortedList(
-                [ref3, ref4], key=sorting_fn
+                [ref3, ref4], key=_ANNOTATION_SORTING_FN
             ),
             # empty list corresponds to Entry, test only
-            "forte.data.ontology.core.Entry": SortedList([]),
+            "forte.data.ontology.core.Entry": [],
             "forte.data.ontology.top.Annotation": SortedList(
-                [ref5], key=sorting_fn
+                [ref5], key=_ANNOTATION_SORTING_FN
             ),
             "forte.data.ontology.top.Group": [
                 [
@@ -382,12 +303,13 @@ class DataStoreTest(unittest.TestCase):
             1234567: ref4,
             7654: ref5,
         }
-        self.data_store._DataStore__tid_idx_dict = {
-            10123: ["forte.data.ontology.top.Group", 0],
-            23456: ["forte.data.ontology.top.Group", 1],
-            34567: ["forte.data.ontology.top.Group", 2],
-            88888: ["forte.data.ontology.top.Link", 0],
-        }
+        # DataStore pops from this dict but never edits the [type, index]
+        # pairs, so a shallow copy keeps the tests independent.
+        self.data_store._DataStore__tid_idx_dict = dict(_TID_IDX_DICT)
+        # Register the Group and Link entries above, so that tests do not
+        # depend on an earlier test having added these types.
+        for type_name, _ in _TID_IDX_DICT.values():
+            self.data_store._get_type_info(type_name)
 
     def test_get_type_info(self):
         # initialize
@@ -402,11 +324,11 @@ class DataStoreTest(unittest.TestCase):
 
         self.assertEqual(
             DataStore._type_attributes["ft.onto.base_ontology.Sentence"],
-            self.reference_type_attributes["ft.onto.base_ontology.Sentence"],
+            _REFERENCE_TYPE_ATTRIBUTES["ft.onto.base_ontology.Sentence"],
         )
         self.assertEqual(
             DataStore._type_attributes["ft.onto.base_ontology.Document"],
-            self.reference_type_attributes["ft.onto.base_ontology.Document"],
+            _REFERENCE_TYPE_ATTRIBUTES["ft.onto.base_ontology.Document"],
         )
         # test the return value
         self.assertEqual(
@@ -440,7 +362,6 @@ class DataStoreTest(unittest.TestCase):
         ):
             DataStore(dynamically_add_type=False)
 
-        DataStore._type_attributes = self.reference_type_attributes
         # TODO: need more tests for ontology file input
 
     def test_entry_methods(self):
@@ -448,15 +369,16 @@ class DataStoreTest(unittest.TestCase):
         doc_type = "ft.onto.base_ontology.Document"
         ann_type = "forte.data.ontology.top.Annotation"
         group_type = "forte.data.ontology.top.Group"
-        sent_list = list(self.data_store._DataStore__elements[sent_type])
-        doc_list = list(self.data_store._DataStore__elements[doc_type])
+        elements = self.data_store._DataStore__elements
+        sent_list = list(elements[sent_type])
+        doc_list = elements[doc_type]
         ann_list = list(
             self.data_store.co_iterator_annotation_like(
                 list(self.data_store._get_all_subclass(ann_type, True))
             )
         )
 
-        group_list = list(self.data_store._DataStore__elements[group_type])
+        num_groups = len(elements[group_type])
         sent_entries = list(self.data_store.all_entries(sent_type))
         doc_entries = list(self.data_store.all_entries(doc_type))
         ann_entries = list(self.data_store.all_entries(ann_type))
@@ -498,7 +420,7 @@ class DataStoreTest(unittest.TestCase):
         # remove a group
         self.data_store.delete_entry(23456)
         num_group_entries = self.data_store.num_entries(group_type)
-        self.assertEqual(num_group_entries, len(group_list) - 1)
+        self.assertEqual(num_group_entries, num_groups - 1)
 
     def test_co_iterator_annotation_like(self):
         type_names = [
@@ -611,8 +533,9 @@ class DataStoreTest(unittest.TestCase):
             constants.ATTR_INFO_KEY
         ]["begin"][constants.ATTR_INDEX_KEY]
 
-        self.data_store._DataStore__elements[doc_tn][0][begin_idx] = 0
-        self.data_store._DataStore__elements[doc_tn][1][begin_idx] = 0
+        doc_entries = self.data_store._DataStore__elements[doc_tn]
+        doc_entries[0][begin_idx] = 0
+        doc_entries[1][begin_idx] = 0
         elements = list(self.data_store.co_iterator_annotation_like(type_names))
         self.assertEqual(elements, ordered_elements)
 
@@ -674,8 +597,9 @@ class DataStoreTest(unittest.TestCase):
             constants.ATTR_INFO_KEY
         ]["end"][constants.ATTR_INDEX_KEY]
 
-        self.data_store._DataStore__elements[sent_tn][0][begin_idx] = 0
-        self.data_store._DataStore__elements[sent_tn][0][end_idx] = 5
+        first_sent = self.data_store._DataStore__elements[sent_tn][0]
+        first_sent[begin_idx] = 0
+        first_sent[end_idx] = 5
         elements = list(self.data_store.co_iterator_annotation_like(type_names))
         self.assertEqual(elements, ordered_elements1)
         type_names.reverse()
@@ -699,6 +623,7 @@ class DataStoreTest(unittest.TestCase):
         self.assertRaises(ValueError, value_err_fn)
 
     def test_add_annotation_raw(self):
+        elements = self.data_store._DataStore__elements
 
         # test add Document entry
         tid_doc: int = self.data_store.add_entry_raw(
@@ -761,11 +686,7 @@ class DataStoreTest(unittest.TestCase):
             attribute_data=[5, 8],
         )
         self.assertEqual(
-            len(
-                self.data_store._DataStore__elements[
-                    "ft.onto.base_ontology.Sentence"
-                ]
-            ),
+            len(elements["ft.onto.base_ontology.Sentence"]),
             num_sent,
         )
         self.assertEqual(tid_sent, tid_sent_duplicate)
@@ -775,11 +696,7 @@ class DataStoreTest(unittest.TestCase):
             attribute_data=[5, 9],
         )
         self.assertEqual(
-            len(
-                self.data_store._DataStore__elements[
-                    "ft.onto.base_ontology.Sentence"
-                ]
-            ),
+            len(elements["ft.onto.base_ontology.Sentence"]),
             num_sent + 1,
         )
 
@@ -807,6 +724,7 @@ class DataStoreTest(unittest.TestCase):
         )
 
     def test_add_audio_annotation_raw(self):
+        elements = self.data_store._DataStore__elements
         # test add Document entry
         tid_recording: int = self.data_store.add_entry_raw(
             type_name="ft.onto.base_ontology.Recording",
@@ -823,29 +741,17 @@ class DataStoreTest(unittest.TestCase):
         )
         # check number of Recording
         self.assertEqual(
-            len(
-                self.data_store._DataStore__elements[
-                    "ft.onto.base_ontology.Recording"
-                ]
-            ),
+            len(elements["ft.onto.base_ontology.Recording"]),
             1,
         )
         # check number of AudioUtterance
         self.assertEqual(
-            len(
-                self.data_store._DataStore__elements[
-                    "ft.onto.base_ontology.AudioUtterance"
-                ]
-            ),
+            len(elements["ft.onto.base_ontology.AudioUtterance"]),
             1,
         )
         # check number of Utterance
         self.assertEqual(
-            len(
-                self.data_store._DataStore__elements[
-                    "ft.onto.base_ontology.Utterance"
-                ]
-            ),
+            len(elements["ft.onto.base_ontology.Utterance"]),
             1,
         )
         tid = 77
@@ -956,16 +862,13 @@ class DataStoreTest(unittest.TestCase):
         )
 
     def test_add_multientry_raw(self):
+        elements = self.data_store._DataStore__elements
         self.data_store.add_entry_raw(
             type_name="forte.data.ontology.top.MultiPackGeneric",
         )
         # check number of MultiPackGeneric
         self.assertEqual(
-            len(
-                self.data_store._DataStore__elements[
-                    "forte.data.ontology.top.MultiPackGeneric"
-                ]
-            ),
+            len(elements["forte.data.ontology.top.MultiPackGeneric"]),
             1,
         )
 
@@ -975,11 +878,7 @@ class DataStoreTest(unittest.TestCase):
         )
         # check number of MultiPackGeneric
         self.assertEqual(
-            len(
-                self.data_store._DataStore__elements[
-                    "forte.data.ontology.top.MultiPackGroup"
-                ]
-            ),
+            len(elements["forte.data.ontology.top.MultiPackGroup"]),
             1,
         )
 
@@ -992,11 +891,7 @@ class DataStoreTest(unittest.TestCase):
         )
         # check number of MultiPackGeneric
         self.assertEqual(
-            len(
-                self.data_store._DataStore__elements[
-                    "forte.data.ontology.top.MultiPackLink"
-                ]
-            ),
+            len(elements["forte.data.ontology.top.MultiPackLink"]),
             1,
         )
 
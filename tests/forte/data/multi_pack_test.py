@@ -191,6 +191,14 @@ class DataPackTest(unittest.TestCase):
             ],
         )
 
+        for link in self.multi_pack.all_links:
+            self.assertEqual(
+                link.parent_pack_id(), self.multi_pack.packs[0].pack_id
+            )
+            self.assertEqual(
+                link.child_pack_id(), self.multi_pack.packs[1].pack_id
+            )
+
         # Another way to get the links
         linked_tokens = []
         for link in self.multi_pack.get(MultiPackLink):
@@ -272,6 +280,25 @@ class DataPackTest(unittest.TestCase):
             ],
         )
 
+    def test_legacy_link_pack_ids(self):
+        # Before version 0.0.1 the links stored the index of the pack in the
+        # multi pack instead of its pack_id.
+        _space_token(self.data_pack1)
+        _space_token(self.data_pack2)
+        parent = self.data_pack1.get_single(Token)
+        child = self.data_pack2.get_single(Token)
+        link = self.multi_pack.add_entry(
+            MultiPackLink(self.multi_pack, parent, child)
+        )
+        self.assertEqual(link.parent_pack_id(), self.data_pack1.pack_id)
+        self.assertEqual(link.child_pack_id(), self.data_pack2.pack_id)
+
+        self.multi_pack.pack_version = "0.0.0"
+        link.parent = (0, parent.tid)
+        link.child = (1, child.tid)
+        self.assertEqual(link.parent_pack_id(), self.data_pack1.pack_id)
+        self.assertEqual(link.child_pack_id(), self.data_pack2.pack_id)
+
     def test_remove_pack(self):
 
         """
@@ -0,0 +1,47 @@
+# Copyright 2022 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for Query.
+"""
+
+import unittest
+
+from forte.data.data_pack import DataPack
+from forte.data.ontology.top import Query
+
+
+class QueryTest(unittest.TestCase):
+    def setUp(self):
+        self.pack = DataPack()
+        self.query = Query(self.pack)
+        self.query.update_results(
+            {"doc1": 0.2, "doc2": 0.9, "doc3": 0.5, "doc4": 0.7}
+        )
+        self.pack.add_all_remaining_entries()
+
+    def test_top_k(self):
+        self.assertEqual(self.query.top_k(2), [("doc2", 0.9), ("doc4", 0.7)])
+
+    def test_top_k_more_than_results(self):
+        self.assertEqual(
+            self.query.top_k(10),
+            [("doc2", 0.9), ("doc4", 0.7), ("doc3", 0.5), ("doc1", 0.2)],
+        )
+
+    def test_top_k_zero(self):
+        self.assertEqual(self.query.top_k(0), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,7 +20,12 @@ from forte.data.modality import Modality
 import numpy as np
 
 from numpy import array_equal
-from forte.data.ontology.top import Box, ImageAnnotation, ImagePayload
+from forte.data.ontology.top import (
+    Box,
+    ImageAnnotation,
+    ImagePayload,
+    Region,
+)
 
 from forte.data.data_pack import DataPack
 import unittest
@@ -34,9 +39,7 @@ class ImageAnnotationTest(unittest.TestCase):
     def setUp(self):
         self.datapack = DataPack("image")
         self.line = np.zeros((6, 12))
-        self.line[2, 2] = 1
-        self.line[3, 3] = 1
-        self.line[4, 4] = 1
+        self.line[[2, 3, 4], [2, 3, 4]] = 1
         ip = ImagePayload(self.datapack)
         ip.cache = self.line
         self.img_ann = ImageAnnotation(self.datapack)
@@ -145,3 +148,70 @@ class ImageAnnotationTest(unittest.TestCase):
 
         b3 = Box.init_from_center_n_shape(self.datapack, 4, 4, 5, 5)
         self.datapack.add_all_remaining_entries()
+
+    def test_is_overlapped(self):
+        self.assertEqual(self.img_ann.image_shape, (6, 12))
+
+        b1 = Box(self.datapack, [0, 0], [2, 2], 0)
+        b2 = Box(self.datapack, [1, 1], [3, 3], 0)
+        b3 = Box(self.datapack, [3, 4], [5, 6], 0)
+        # The bottom right corner is clipped to the image.
+        b4 = Box(self.datapack, [4, 10], [9, 20], 0)
+
+        self.assertTrue(b1.is_overlapped(b2))
+        self.assertTrue(b2.is_overlapped(b1))
+        self.assertFalse(b1.is_overlapped(b3))
+        self.assertFalse(b3.is_overlapped(b4))
+        self.assertEqual(b4.box_max_x, 11)
+        self.assertEqual(b4.box_max_y, 5)
+
+        boxes = [b1, b2, b3, b4]
+        overlaps = Box.is_overlapped_batch(boxes, boxes)
+        self.assertEqual(overlaps.shape, (4, 4))
+        for i, box in enumerate(boxes):
+            for j, other in enumerate(boxes):
+                self.assertEqual(overlaps[i, j], box.is_overlapped(other))
+        self.datapack.add_all_remaining_entries()
+
+    def test_image_serialization(self):
+        datapack = DataPack("image3")
+        image = np.arange(12, dtype=np.uint8).reshape((3, 4))
+        datapack.add_image(image)
+
+        recovered = DataPack.from_string(datapack.to_string())
+        self.assertEqual(recovered.image.dtype, np.uint8)
+        self.assertTrue(array_equal(recovered.image, image))
+
+    def test_image_annotation_eq(self):
+        b1 = Box(self.datapack, [0, 0], [2, 2], 0)
+        b2 = Box(self.datapack, [1, 1], [3, 3], 0)
+        b3 = Box(self.datapack, [0, 0], [2, 2], 0)
+        region = Region(self.datapack, 0)
+
+        self.assertNotEqual(b1, b2)
+        self.assertEqual(len({b1, b2}), 2)
+        self.assertEqual(b1, b3)
+        self.assertEqual(hash(b1), hash(b3))
+        self.assertNotEqual(b1, region)
+        self.assertNotEqual(self.img_ann, region)
+
+        # Regions have no geometry of their own, different Region entries on
+        # the same image are still different entries.
+        region2 = Region(self.datapack, 0)
+        self.assertNotEqual(region, region2)
+        self.assertEqual(len({region, region2}), 2)
+        self.assertEqual(region, region)
+        self.datapack.add_all_remaining_entries()
+
+    def test_compute_iou_batch(self):
+        b1 = Box(self.datapack, [0, 0], [2, 2], 0)
+        b2 = Box(self.datapack, [1, 1], [3, 3], 0)
+        b3 = Box(self.datapack, [4, 4], [5, 6], 0)
+
+        ious = Box.compute_iou_batch([b1, b2], [b1, b2, b3])
+        self.assertEqual(ious.shape, (2, 3))
+        self.assertTrue(np.allclose(ious, [[1, 1 / 7, 0], [1 / 7, 1, 0]]))
+        for i, box in enumerate([b1, b2]):
+            for j, other in enumerate([b1, b2, b3]):
+                self.assertAlmostEqual(box.compute_iou(other), ious[i, j])
+        self.datapack.add_all_remaining_entries()
@@ -15,10 +15,10 @@
 Unit tests for Random Word Splitting Data Augmentation processor
 """
 
+import re
 import unittest
 import random
 
-from ddt import ddt, data, unpack
 from ft.onto.base_ontology import Token, EntityMention
 from forte.data.selector import AllPackSelector
 from forte.pipeline import Pipeline
@@ -43,12 +43,16 @@ class EntityMentionInserter(PackProcessor):
         entity_text = self.configs.entities_to_insert
 
         input_text = input_pack.text
-        if not all(bool(entity in input_text) for entity in entity_text):
+        starts = [input_text.find(entity) for entity in entity_text]
+        missing = [
+            entity for entity, start in zip(entity_text, starts) if start == -1
+        ]
+        if missing:
             raise Exception(
-                "Entities to be added are not valid for the input text."
+                f"Entities to be added are not valid for the input text: "
+                f"{missing}"
             )
-        for entity in entity_text:
-            start = input_text.index(entity)
+        for entity, start in zip(entity_text, starts):
             end = start + len(entity)
             entity_mention = EntityMention(input_pack, start, end)
             input_pack.add_entry(entity_mention)
@@ -58,7 +62,6 @@ class EntityMentionInserter(PackProcessor):
         return {"entities_to_insert": []}
 
 
-@ddt
 class TestWordSplittingProcessor(unittest.TestCase):
     """
     This class tests the correctness of word splitting data augmentation.
@@ -70,21 +73,9 @@ class TestWordSplittingProcessor(unittest.TestCase):
     - If the entities are retained after augmentation.
     """
 
-    def setUp(self):
-        random.seed(8)
-        self.nlp = Pipeline[MultiPack]()
-
-        boxer_config = {"pack_name": "input_src"}
-        entity_config = {"entities_to_insert": ["Mary", "station"]}
-        self.nlp.set_reader(reader=StringReader())
-        self.nlp.add(component=EntityMentionInserter(), config=entity_config)
-        self.nlp.add(PeriodSentenceSplitter())
-        self.nlp.add(component=MultiPackBoxer(), config=boxer_config)
-        self.nlp.add(
-            component=WhiteSpaceTokenizer(), selector=AllPackSelector()
-        )
-
-    @data(
+    # Each case is (texts, expected_outputs, expected_tokens,
+    # unnecessary_tokens, new_entities).
+    CASES = [
         (
             [
                 "Mary and Samantha arrived at the bus station on time . "
@@ -125,18 +116,18 @@ class TestWordSplittingProcessor(unittest.TestCase):
             ],
             [["station", "they", "had"]],
             [["Mary", "statio n", "t hey"]],
-        )
-    )
-    @unpack
-    def test_word_splitting_processor(
-        self,
-        texts,
-        expected_outputs,
-        expected_tokens,
-        unnecessary_tokens,
-        new_entities,
-    ):
-        entity_config = {
+        ),
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        # None of the stages keep state between packs, so the pipeline is
+        # built and initialized once for all the test cases.
+        cls.nlp = Pipeline[MultiPack]()
+
+        boxer_config = {"pack_name": "input_src"}
+        entity_config = {"entities_to_insert": ["Mary", "station"]}
+        aug_config = {
             "data_aug_op": "forte.processors.data_augment.algorithms.word_splitting_op.RandomWordSplitDataAugmentOp",
             "data_aug_op_config": {
                 "other_entry_policy": {
@@ -144,26 +135,52 @@ class TestWordSplittingProcessor(unittest.TestCase):
                 }
             },
         }
-        self.nlp.add(
-            component=DataAugProcessor(),
-            config=entity_config,
+        cls.nlp.set_reader(reader=StringReader())
+        cls.nlp.add(component=EntityMentionInserter(), config=entity_config)
+        cls.nlp.add(PeriodSentenceSplitter())
+        cls.nlp.add(component=MultiPackBoxer(), config=boxer_config)
+        cls.nlp.add(component=WhiteSpaceTokenizer(), selector=AllPackSelector())
+        cls.nlp.add(component=DataAugProcessor(), config=aug_config)
+        cls.nlp.initialize()
+
+    def test_word_splitting_processor(self):
+        random.seed(8)
+        # The texts of all the cases go through one process_dataset call.
+        m_packs = iter(
+            self.nlp.process_dataset(
+                [text for case in self.CASES for text in case[0]]
+            )
         )
-        self.nlp.initialize()
-
-        for idx, m_pack in enumerate(self.nlp.process_dataset(texts)):
-
-            aug_pack = m_pack.get_pack("augmented_input_src")
-
-            self.assertEqual(aug_pack.text, expected_outputs[idx])
-
-            for j, token in enumerate(aug_pack.get(Token)):
-                self.assertEqual(token.text, expected_tokens[idx][j])
-
-            for token in unnecessary_tokens[idx]:
-                self.assertNotIn(token, aug_pack.text)
-
-            for j, token in enumerate(aug_pack.get(EntityMention)):
-                self.assertEqual(token.text, new_entities[idx][j])
+        for case_idx, (texts, *expectations) in enumerate(self.CASES):
+            # Take the packs of this case before checking them, so a failed
+            # case does not shift the packs of the following ones.
+            aug_packs = [
+                next(m_packs).get_pack("augmented_input_src") for _ in texts
+            ]
+            with self.subTest(case=case_idx):
+                for aug_pack, output, tokens, unsplit, entities in zip(
+                    aug_packs, *expectations
+                ):
+                    self.assertEqual(aug_pack.text, output)
+
+                    self.assertEqual(
+                        [token.text for token in aug_pack.get(Token)], tokens
+                    )
+
+                    # Scan the text once for any of the words that should
+                    # be split. An empty pattern would match anything.
+                    if unsplit:
+                        found = re.search(
+                            "|".join(map(re.escape, unsplit)), aug_pack.text
+                        )
+                        self.assertIsNone(
+                            found,
+                            f"Found unsplit word: "
+                            f"{found.group(0) if found else None}",
+                        )
+
+                    for j, token in enumerate(aug_pack.get(EntityMention)):
+                        self.assertEqual(token.text, entities[j])
 
 
 if __name__ == "__main__":
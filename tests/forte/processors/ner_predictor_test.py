@@ -0,0 +1,78 @@
+# Copyright 2022 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the dtype configuration of CoNLLNERPredictor.
+"""
+import unittest
+from unittest.mock import patch
+
+import torch
+
+from forte.common import ProcessorConfigError
+from forte.common.resources import Resources
+from forte.processors.nlp.ner_predictor import CoNLLNERPredictor
+
+
+class CoNLLNERPredictorDtypeTest(unittest.TestCase):
+    """
+    The dtype is checked before any resource is loaded, so these tests do
+    not need the NER model files.
+    """
+
+    def setUp(self):
+        self.predictor = CoNLLNERPredictor()
+
+    def test_unknown_dtype(self):
+        configs = CoNLLNERPredictor.make_configs({"dtype": "float16"})
+        with self.assertRaises(ProcessorConfigError):
+            self.predictor.initialize(Resources(), configs)
+
+    @patch("torch.cuda.is_available", return_value=False)
+    def test_bfloat16_ignored_on_cpu(self, _):
+        configs = CoNLLNERPredictor.make_configs({"dtype": "bfloat16"})
+        # The dtype check passes with a warning, initialization then stops at
+        # the missing model files.
+        with self.assertLogs(
+            "forte.processors.nlp.ner_predictor", level="WARNING"
+        ):
+            with self.assertRaises(FileNotFoundError):
+                self.predictor.initialize(Resources(), configs)
+        self.assertFalse(self.predictor._use_bf16)
+
+    @patch("torch.cuda.is_available", return_value=True)
+    def test_bfloat16_without_autocast(self, _):
+        # torch.autocast only exists from torch 1.10.
+        if hasattr(torch, "autocast"):
+            autocast = torch.autocast
+            del torch.autocast
+            self.addCleanup(setattr, torch, "autocast", autocast)
+
+        configs = CoNLLNERPredictor.make_configs({"dtype": "bfloat16"})
+        with self.assertRaisesRegex(ProcessorConfigError, "torch.autocast"):
+            self.predictor.initialize(Resources(), configs)
+
+    @patch("torch.cuda.is_available", return_value=True)
+    def test_bfloat16_unsupported_on_cuda(self, _):
+        configs = CoNLLNERPredictor.make_configs({"dtype": "bfloat16"})
+        with patch.object(torch, "autocast", create=True), patch.object(
+            torch.cuda, "is_bf16_supported", create=True, return_value=False
+        ):
+            with self.assertRaisesRegex(
+                ProcessorConfigError, "not supported by the current CUDA"
+            ):
+                self.predictor.initialize(Resources(), configs)
+
+
+if __name__ == "__main__":
+    unittest.main()